@@ -21,7 +21,7 @@ from hummingbot.client.ui.style import load_style
 from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.event.events import HummingbotUIEvent
 from hummingbot.core.utils import detect_available_port
-from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.async_utils import install_uvloop, safe_gather
 
 
 class UIStartListener(EventListener):
@@ -76,6 +76,7 @@ async def main_async(client_config_map: ClientConfigAdapter):
 
 
 def main():
+    install_uvloop()
     chdir_to_data_directory()
     secrets_manager_cls = ETHKeyFileSecretManger
 
@@ -30,7 +30,7 @@ from hummingbot.client.ui import login_prompt
 from hummingbot.client.ui.style import load_style
 from hummingbot.core.event.events import HummingbotUIEvent
 from hummingbot.core.management.console import start_management_console
-from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.async_utils import install_uvloop, safe_gather
 
 
 class CmdlineParser(argparse.ArgumentParser):
@@ -128,6 +128,7 @@ async def quick_start(args: argparse.Namespace, secrets_manager: BaseSecretsMana
 
 
 def main():
+    install_uvloop()
     args = CmdlineParser().parse_args()
 
     # Parse environment variables from Dockerfile.
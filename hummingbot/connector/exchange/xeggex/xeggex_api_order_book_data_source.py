@@ -5,8 +5,6 @@ from decimal import Decimal
 from typing import Any, Dict, List, Optional
 
 import aiohttp
-import numpy as np
-import pandas as pd
 
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
@@ -23,6 +21,7 @@ from .xeggex_websocket import XeggexWebsocket
 class XeggexAPIOrderBookDataSource(OrderBookTrackerDataSource):
     _logger: Optional[HummingbotLogger] = None
     _trading_pair_symbol_map: Dict[str, str] = {}
+    _symbol_by_pair: Dict[str, str] = {}
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -34,10 +33,12 @@ class XeggexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         super().__init__(trading_pairs)
         self._trading_pairs: List[str] = trading_pairs
         self._snapshot_msg: Dict[str, any] = {}
+        self._symbols: Optional[List[str]] = None
+        self._pair_by_symbol: Dict[str, str] = {}
 
     @classmethod
     async def init_trading_pair_symbols(cls, shared_session: Optional[aiohttp.ClientSession] = None):
-        """Initialize _trading_pair_symbol_map class variable
+        """Initialize _trading_pair_symbol_map and _symbol_by_pair class variables
         """
 
         symbols: List[Dict[str, Any]] = await api_call_with_retries(
@@ -48,6 +49,11 @@ class XeggexAPIOrderBookDataSource(OrderBookTrackerDataSource):
             symbol_data["symbol"]: (f"{symbol_data['primaryAsset']['ticker']}-{symbol_data['secondaryAsset']['ticker']}")
             for symbol_data in symbols
         }
+        symbol_by_pair: Dict[str, str] = {}
+        for symbol, pair in cls._trading_pair_symbol_map.items():
+            # Keep the first symbol listed for a pair
+            symbol_by_pair.setdefault(pair, symbol)
+        cls._symbol_by_pair = symbol_by_pair
 
     @classmethod
     async def trading_pair_symbol_map(cls) -> Dict[str, str]:
@@ -59,29 +65,32 @@ class XeggexAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, Decimal]:
         results = {}
-        if len(trading_pairs) > 1:
-            tickers: List[Dict[Any]] = await api_call_with_retries("GET", Constants.ENDPOINT["TICKER"])
+        tickers: List[Dict[Any]] = await api_call_with_retries("GET", Constants.ENDPOINT["TICKER"])
+        last_price_by_symbol: Dict[str, Any] = {tic["symbol"]: tic["last_price"] for tic in tickers}
         for trading_pair in trading_pairs:
             ex_pair: str = await XeggexAPIOrderBookDataSource.exchange_symbol_associated_to_pair(trading_pair)
-            if len(trading_pairs) > 1:
-                ticker: Dict[Any] = list([tic for tic in tickers if tic['symbol'] == ex_pair])[0]
-            else:
-                url_endpoint = Constants.ENDPOINT["TICKER_SINGLE"].format(trading_pair=ex_pair.replace("/", "_"))
-                ticker: Dict[Any] = await api_call_with_retries("GET", url_endpoint)
-            results[trading_pair]: Decimal = Decimal(str(ticker["last_price"]))
+            last_price = last_price_by_symbol[ex_pair]
+            # Prices are usually sent as strings, only numbers need the round-trip through str
+            results[trading_pair]: Decimal = (Decimal(last_price) if isinstance(last_price, str)
+                                              else Decimal(str(last_price)))
         return results
 
     @staticmethod
     async def exchange_symbol_associated_to_pair(trading_pair: str) -> str:
-        symbol_map = await XeggexAPIOrderBookDataSource.trading_pair_symbol_map()
-        symbols = [symbol for symbol, pair in symbol_map.items() if pair == trading_pair]
-
-        if symbols:
-            symbol = symbols[0]
-        else:
+        await XeggexAPIOrderBookDataSource.trading_pair_symbol_map()
+        try:
+            return XeggexAPIOrderBookDataSource._symbol_by_pair[trading_pair]
+        except KeyError:
             raise ValueError(f"There is no symbol mapping for trading pair {trading_pair}")
 
-        return symbol
+    async def _subscription_symbols(self) -> List[str]:
+        """
+        Resolves the exchange symbols of the tracked trading pairs once, they do not change between reconnects
+        """
+        if self._symbols is None:
+            self._symbols = [await self.exchange_symbol_associated_to_pair(pair) for pair in self._trading_pairs]
+            self._pair_by_symbol = dict(zip(self._symbols, self._trading_pairs))
+        return self._symbols
 
     @staticmethod
     async def trading_pair_associated_to_exchange_symbol(symbol: str) -> str:
@@ -112,30 +121,20 @@ class XeggexAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
         snapshot: Dict[str, Any] = await self.get_order_book_data(trading_pair)
         snapshot_timestamp: float = time.time()
+        # The levels are only needed to build the rows below, keep them out of the message content
+        snapshot_bids: List[List[str]] = snapshot.pop("bids")
+        snapshot_asks: List[List[str]] = snapshot.pop("asks")
         snapshot_msg: OrderBookMessage = XeggexOrderBook.snapshot_message_from_exchange(
             snapshot,
             snapshot_timestamp,
             metadata={"trading_pair": trading_pair})
         order_book = self.order_book_create_function()
 
-        np_bids = np.array(
-            [[snapshot_msg.timestamp,
-                float(item[0]),
-                float(item[1]),
-                snapshot_msg.update_id]
-                for item in snapshot["bids"]], dtype='float64', ndmin=2)
+        update_id: int = snapshot_msg.update_id
+        bids = [OrderBookRow(float(price), float(qty), update_id) for price, qty in snapshot_bids]
+        asks = [OrderBookRow(float(price), float(qty), update_id) for price, qty in snapshot_asks]
 
-        np_asks = np.array(
-            [[snapshot_msg.timestamp,
-                float(item[0]),
-                float(item[1]),
-                snapshot_msg.update_id]
-                for item in snapshot["asks"]], dtype='float64', ndmin=2)
-
-        bids = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_bids]
-        asks = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_asks]
-
-        order_book.apply_snapshot(bids, asks, snapshot_msg.update_id)
+        order_book.apply_snapshot(bids, asks, update_id)
         return order_book
 
     async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
@@ -147,8 +146,7 @@ class XeggexAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 ws = XeggexWebsocket()
                 await ws.connect()
 
-                for pair in self._trading_pairs:
-                    symbol = await XeggexAPIOrderBookDataSource.exchange_symbol_associated_to_pair(pair)
+                for symbol in await self._subscription_symbols():
                     await ws.subscribe(Constants.WS_SUB["TRADES"], symbol)
 
                 async for response in ws.on_message():
@@ -158,7 +156,7 @@ class XeggexAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     if trades_data is None or method != Constants.WS_METHODS['TRADES_UPDATE']:
                         continue
 
-                    pair: str = await self.trading_pair_associated_to_exchange_symbol(response["params"]["symbol"])
+                    pair: str = self._pair_by_symbol[trades_data["symbol"]]
 
                     for trade in trades_data["data"]:
                         trade: Dict[Any] = trade
@@ -186,15 +184,17 @@ class XeggexAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 ws = XeggexWebsocket()
                 await ws.connect()
 
-                order_book_methods = [
-                    Constants.WS_METHODS['ORDERS_SNAPSHOT'],
-                    Constants.WS_METHODS['ORDERS_UPDATE'],
-                ]
-
-                for pair in self._trading_pairs:
-                    symbol = await XeggexAPIOrderBookDataSource.exchange_symbol_associated_to_pair(pair)
+                for symbol in await self._subscription_symbols():
                     await ws.subscribe(Constants.WS_SUB["ORDERS"], symbol)
 
+                # Bind everything the dispatch loop needs once per connection
+                orders_update: str = Constants.WS_METHODS['ORDERS_UPDATE']
+                order_book_methods = {Constants.WS_METHODS['ORDERS_SNAPSHOT'], orders_update}
+                diff_message_from_exchange = XeggexOrderBook.diff_message_from_exchange
+                snapshot_message_from_exchange = XeggexOrderBook.snapshot_message_from_exchange
+                pair_by_symbol: Dict[str, str] = self._pair_by_symbol
+                put_nowait = output.put_nowait
+
                 async for response in ws.on_message():
                     method: str = response.get("method", None)
                     order_book_data: str = response.get("params", None)
@@ -203,17 +203,17 @@ class XeggexAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         continue
 
                     timestamp: int = str_date_to_ts(order_book_data["timestamp"])
-                    pair: str = await self.trading_pair_associated_to_exchange_symbol(order_book_data["symbol"])
+                    pair: str = pair_by_symbol[order_book_data["symbol"]]
 
-                    order_book_msg_cls = (XeggexOrderBook.diff_message_from_exchange
-                                          if method == Constants.WS_METHODS['ORDERS_UPDATE'] else
-                                          XeggexOrderBook.snapshot_message_from_exchange)
+                    order_book_msg_cls = (diff_message_from_exchange
+                                          if method == orders_update else
+                                          snapshot_message_from_exchange)
 
                     orderbook_msg: OrderBookMessage = order_book_msg_cls(
                         order_book_data,
                         timestamp,
                         metadata={"trading_pair": pair})
-                    output.put_nowait(orderbook_msg)
+                    put_nowait(orderbook_msg)
 
             except asyncio.CancelledError:
                 raise
@@ -253,9 +253,8 @@ class XeggexAPIOrderBookDataSource(OrderBookTrackerDataSource):
                             app_warning_msg="Unexpected error with WebSocket connection. Retrying in 5 seconds. "
                                             "Check network connection.")
                         await asyncio.sleep(5.0)
-                this_hour: pd.Timestamp = pd.Timestamp.utcnow().replace(minute=0, second=0, microsecond=0)
-                next_hour: pd.Timestamp = this_hour + pd.Timedelta(hours=1)
-                delta: float = next_hour.timestamp() - time.time()
+                # Sleep until the top of the next hour
+                delta: float = 3600 - (time.time() % 3600)
                 await asyncio.sleep(delta)
             except asyncio.CancelledError:
                 raise
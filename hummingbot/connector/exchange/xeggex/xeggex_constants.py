@@ -10,7 +10,6 @@ class Constants:
     ENDPOINT = {
         # Public Endpoints REST API
         "TICKER": "tickers",
-        "TICKER_SINGLE": "ticker/{trading_pair}",
         "SYMBOL": "market/getlist",
         "ORDER_BOOK": "orderbook",
         "ORDER_CREATE": "createorder",
@@ -42,6 +41,8 @@ class Constants:
     PING_TIMEOUT = 10.0
     API_CALL_TIMEOUT = 10.0
     API_MAX_RETRIES = 4
+    API_MAX_RETRY_SLEEP = 60.0
+    API_CONNECTION_LIMIT = 20
 
     # Intervals
     # Only used when nothing is received from WS
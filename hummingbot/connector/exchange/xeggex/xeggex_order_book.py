@@ -1,3 +1,4 @@
+import functools
 import logging
 from typing import Any, Dict, List, Optional
 
@@ -7,16 +8,12 @@ from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.logger import HummingbotLogger
 
-_logger = None
-
 
 class XeggexOrderBook(OrderBook):
     @classmethod
+    @functools.cache
     def logger(cls) -> HummingbotLogger:
-        global _logger
-        if _logger is None:
-            _logger = logging.getLogger(__name__)
-        return _logger
+        return logging.getLogger(__name__)
 
     @classmethod
     def snapshot_message_from_exchange(cls,
@@ -30,12 +27,11 @@ class XeggexOrderBook(OrderBook):
         :return: XeggexOrderBookMessage
         """
 
-        if metadata:
-            msg.update(metadata)
+        content = {**msg, **metadata} if metadata else msg
 
         return XeggexOrderBookMessage(
             message_type=OrderBookMessageType.SNAPSHOT,
-            content=msg,
+            content=content,
             timestamp=timestamp
         )
 
@@ -51,12 +47,11 @@ class XeggexOrderBook(OrderBook):
         :return: XeggexOrderBookMessage
         """
 
-        if metadata:
-            msg.update(metadata)
+        content = {**msg, **metadata} if metadata else msg
 
         return XeggexOrderBookMessage(
             message_type=OrderBookMessageType.DIFF,
-            content=msg,
+            content=content,
             timestamp=timestamp
         )
 
@@ -71,19 +66,17 @@ class XeggexOrderBook(OrderBook):
         :return: XeggexOrderBookMessage
         """
 
-        if metadata:
-            msg.update(metadata)
-
-        msg.update({
+        content = {
+            **msg,
+            **(metadata or {}),
             "exchange_order_id": msg.get("id"),
             "trade_type": msg.get("side"),
-            "price": msg.get("price"),
             "amount": msg.get("quantity"),
-        })
+        }
 
         return XeggexOrderBookMessage(
             message_type=OrderBookMessageType.TRADE,
-            content=msg,
+            content=content,
             timestamp=timestamp
         )
 
@@ -5,6 +5,10 @@ from hummingbot.core.data_type.order_book_row import OrderBookRow
 
 from .xeggex_constants import Constants
 
+_SNAPSHOT = OrderBookMessageType.SNAPSHOT
+_TRADE = OrderBookMessageType.TRADE
+_ORDER_BOOK_TYPES = (OrderBookMessageType.DIFF, _SNAPSHOT)
+
 
 class XeggexOrderBookMessage(OrderBookMessage):
     def __new__(
@@ -16,7 +20,7 @@ class XeggexOrderBookMessage(OrderBookMessage):
         **kwargs,
     ):
         if timestamp is None:
-            if message_type is OrderBookMessageType.SNAPSHOT:
+            if message_type is _SNAPSHOT:
                 raise ValueError("timestamp must not be None when initializing snapshot messages.")
             timestamp = content["timestamp"]
 
@@ -26,14 +30,14 @@ class XeggexOrderBookMessage(OrderBookMessage):
 
     @property
     def update_id(self) -> int:
-        if self.type in [OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT]:
+        if self.type in _ORDER_BOOK_TYPES:
             return int(self.timestamp * 1e3)
         else:
             return -1
 
     @property
     def trade_id(self) -> int:
-        if self.type is OrderBookMessageType.TRADE:
+        if self.type is _TRADE:
             return int(self.timestamp * 1e3)
         return -1
 
@@ -6,8 +6,6 @@ import time
 from collections import defaultdict, deque
 from typing import Deque, Dict, List, Optional
 
-import numpy as np
-
 from hummingbot.connector.exchange.xeggex.xeggex_api_order_book_data_source import XeggexAPIOrderBookDataSource
 from hummingbot.connector.exchange.xeggex.xeggex_constants import Constants
 from hummingbot.connector.exchange.xeggex.xeggex_order_book import XeggexOrderBook
@@ -17,7 +15,16 @@ from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.logger import HummingbotLogger
 
-s_empty_diff = np.ndarray(shape=(0, 4), dtype="float64")
+
+def _order_book_rows(levels: List, update_id: int) -> List[OrderBookRow]:
+    """
+    Converts order book levels, sent either as [price, quantity] pairs or as {"price", "quantity"} dicts, into rows
+    """
+    if not levels:
+        return []
+    if isinstance(levels[0], list):
+        return [OrderBookRow(float(price), float(qty), update_id) for price, qty in levels]
+    return [OrderBookRow(float(level["price"]), float(level["quantity"]), update_id) for level in levels]
 
 
 class XeggexOrderBookTracker(OrderBookTracker):
@@ -76,51 +83,11 @@ class XeggexOrderBookTracker(OrderBookTracker):
 
                 if message.type is OrderBookMessageType.DIFF:
                     # new method
-                    mbids = message.content.get('bids')
-                    masks = message.content.get('asks')
-
-                    smsg = str(mbids)
-                    self.logger().info(f"TESTING3... {smsg}.")
-
-                    np_bids = s_empty_diff
-                    np_asks = s_empty_diff
-
-                    if len(mbids) > 0:
-                        if (isinstance(mbids[0], list)):
-                            np_bids = np.array(
-                                [[message.timestamp,
-                                    float(bid[0]),
-                                    float(bid[1]),
-                                    message.update_id]
-                                    for bid in mbids], dtype='float64', ndmin=2)
-                        else:
-                            np_bids = np.array(
-                                [[message.timestamp,
-                                    float(bid["price"]),
-                                    float(bid["quantity"]),
-                                    message.update_id]
-                                    for bid in mbids], dtype='float64', ndmin=2)
-
-                    if len(masks) > 0:
-                        if (isinstance(mbids[0], list)):
-                            np_asks = np.array(
-                                [[message.timestamp,
-                                    float(ask[0]),
-                                    float(ask[1]),
-                                    message.update_id]
-                                    for ask in masks], dtype='float64', ndmin=2)
-                        else:
-                            np_asks = np.array(
-                                [[message.timestamp,
-                                    float(ask["price"]),
-                                    float(ask["quantity"]),
-                                    message.update_id]
-                                    for ask in masks], dtype='float64', ndmin=2)
-
-                    d_bids = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_bids]
-                    d_asks = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_asks]
-
-                    order_book.apply_diffs(d_bids, d_asks, message.update_id)
+                    update_id: int = message.update_id
+                    d_bids = _order_book_rows(message.content.get('bids'), update_id)
+                    d_asks = _order_book_rows(message.content.get('asks'), update_id)
+
+                    order_book.apply_diffs(d_bids, d_asks, update_id)
                     past_diffs_window.append(message)
                     while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
                         past_diffs_window.popleft()
@@ -138,96 +105,16 @@ class XeggexOrderBookTracker(OrderBookTracker):
                     replay_position = bisect.bisect_right(past_diffs, message)
                     replay_diffs = past_diffs[replay_position:]
 
-                    mbids = message.content.get('bids')
-                    masks = message.content.get('asks')
-
-                    smsg = str(mbids)
-                    self.logger().info(f"TESTING2... {smsg}.")
-
-                    np_bids = s_empty_diff
-                    np_asks = s_empty_diff
-
-                    if len(mbids) > 0:
-                        if (isinstance(mbids[0], list)):
-                            np_bids = np.array(
-                                [[message.timestamp,
-                                    float(bid[0]),
-                                    float(bid[1]),
-                                    message.update_id]
-                                    for bid in mbids], dtype='float64', ndmin=2)
-                        else:
-                            np_bids = np.array(
-                                [[message.timestamp,
-                                    float(bid["price"]),
-                                    float(bid["quantity"]),
-                                    message.update_id]
-                                    for bid in mbids], dtype='float64', ndmin=2)
-
-                    if len(masks) > 0:
-                        if (isinstance(mbids[0], list)):
-                            np_asks = np.array(
-                                [[message.timestamp,
-                                    float(ask[0]),
-                                    float(ask[1]),
-                                    message.update_id]
-                                    for ask in masks], dtype='float64', ndmin=2)
-                        else:
-                            np_asks = np.array(
-                                [[message.timestamp,
-                                    float(ask["price"]),
-                                    float(ask["quantity"]),
-                                    message.update_id]
-                                    for ask in masks], dtype='float64', ndmin=2)
-
-                    s_bids = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_bids]
-                    s_asks = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_asks]
-
-                    order_book.apply_snapshot(s_bids, s_asks, message.update_id)
+                    update_id: int = message.update_id
+                    s_bids = _order_book_rows(message.content.get('bids'), update_id)
+                    s_asks = _order_book_rows(message.content.get('asks'), update_id)
+
+                    order_book.apply_snapshot(s_bids, s_asks, update_id)
                     for diff_message in replay_diffs:
-                        mbids = diff_message.content.get('bids')
-                        masks = diff_message.content.get('asks')
-
-                        smsg = str(mbids)
-                        self.logger().info(f"TESTING4... {smsg}.")
-
-                        np_bids = s_empty_diff
-                        np_asks = s_empty_diff
-
-                        if len(mbids) > 0:
-                            if (isinstance(mbids[0], list)):
-                                np_bids = np.array(
-                                    [[diff_message.timestamp,
-                                        float(bid[0]),
-                                        float(bid[1]),
-                                        diff_message.update_id]
-                                        for bid in mbids], dtype='float64', ndmin=2)
-                            else:
-                                np_bids = np.array(
-                                    [[diff_message.timestamp,
-                                        float(bid["price"]),
-                                        float(bid["quantity"]),
-                                        diff_message.update_id]
-                                        for bid in mbids], dtype='float64', ndmin=2)
-
-                        if len(masks) > 0:
-                            if (isinstance(mbids[0], list)):
-                                np_asks = np.array(
-                                    [[diff_message.timestamp,
-                                        float(ask[0]),
-                                        float(ask[1]),
-                                        diff_message.update_id]
-                                        for ask in masks], dtype='float64', ndmin=2)
-                            else:
-                                np_asks = np.array(
-                                    [[diff_message.timestamp,
-                                        float(ask["price"]),
-                                        float(ask["quantity"]),
-                                        diff_message.update_id]
-                                        for ask in masks], dtype='float64', ndmin=2)
-
-                        d_bids = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_bids]
-                        d_asks = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_asks]
-                        order_book.apply_diffs(d_bids, d_asks, diff_message.update_id)
+                        update_id: int = diff_message.update_id
+                        d_bids = _order_book_rows(diff_message.content.get('bids'), update_id)
+                        d_asks = _order_book_rows(diff_message.content.get('asks'), update_id)
+                        order_book.apply_diffs(d_bids, d_asks, update_id)
 
                     self.logger().debug(f"Processed order book snapshot for {trading_pair}.")
             except asyncio.CancelledError:
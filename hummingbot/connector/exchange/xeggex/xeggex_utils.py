@@ -1,8 +1,11 @@
 import asyncio
+import datetime
+import functools
 import random
 from typing import Any, Dict, Optional, Tuple
 
 import aiohttp
+import ujson
 from dateutil.parser import parse as dateparse
 from pydantic import Field, SecretStr
 
@@ -17,6 +20,11 @@ EXAMPLE_PAIR = "BTC_USDT"
 
 DEFAULT_FEES = [0.1, 0.1]
 
+_OK_STATUSES = frozenset((200, 201))
+
+# Shared session for requests made without a client, e.g. public market data polls
+_default_session: Optional[aiohttp.ClientSession] = None
+
 
 class XeggexAPIError(IOError):
     def __init__(self, error_payload: Dict[str, Any]):
@@ -25,7 +33,18 @@ class XeggexAPIError(IOError):
 
 
 # convert date string to timestamp
+@functools.lru_cache(maxsize=4096)
 def str_date_to_ts(date: str) -> int:
+    # Fast path for the UTC ISO-8601 format used by the exchange, e.g. "2023-01-01T12:34:56.789Z"
+    if (len(date) >= 20 and date[-1] == "Z" and date[4] == "-" and date[7] == "-" and date[10] == "T"
+            and date[13] == ":" and date[16] == ":" and date[19] in ".Z"):
+        # datetime rejects out of range fields, which then fall through to dateparse and raise there
+        try:
+            return int(datetime.datetime(int(date[0:4]), int(date[5:7]), int(date[8:10]),
+                                         int(date[11:13]), int(date[14:16]), int(date[17:19]),
+                                         tzinfo=datetime.timezone.utc).timestamp())
+        except ValueError:
+            pass
     return int(dateparse(date).timestamp())
 
 
@@ -50,20 +69,45 @@ def split_trading_pair(trading_pair: str) -> Optional[Tuple[str, str]]:
         return None
 
 
-def get_new_client_order_id(is_buy: bool, trading_pair: str) -> str:
+@functools.lru_cache(maxsize=1024)
+def _pair_to_oid_prefix(trading_pair: str, is_buy: bool) -> str:
     side = "B" if is_buy else "S"
     symbols = trading_pair.split("-")
     base = symbols[0].upper()
     quote = symbols[1].upper()
     base_str = f"{base[0]}{base[-1]}"
     quote_str = f"{quote[0]}{quote[-1]}"
-    return f"{Constants.HBOT_BROKER_ID}-{side}-{base_str}{quote_str}-{get_tracking_nonce()}"
+    return f"{Constants.HBOT_BROKER_ID}-{side}-{base_str}{quote_str}-"
+
+
+def get_new_client_order_id(is_buy: bool, trading_pair: str) -> str:
+    return _pair_to_oid_prefix(trading_pair, is_buy) + str(get_tracking_nonce())
 
 
 def retry_sleep_time(try_count: int) -> float:
-    random.seed()
-    randSleep = 1 + float(random.randint(1, 10) / 100)
-    return float(2 + float(randSleep * (1 + (try_count ** try_count))))
+    # Capped exponential backoff with jitter
+    return min(Constants.API_MAX_RETRY_SLEEP, (2 ** try_count) + random.random())
+
+
+async def _get_session() -> aiohttp.ClientSession:
+    """
+    Lazily creates the module level client session, keeping connections alive between requests.
+    """
+    global _default_session
+    if _default_session is None or _default_session.closed:
+        connector = aiohttp.TCPConnector(limit=Constants.API_CONNECTION_LIMIT, ttl_dns_cache=300, keepalive_timeout=60)
+        _default_session = aiohttp.ClientSession(connector=connector, json_serialize=ujson.dumps)
+    return _default_session
+
+
+async def close_shared_session():
+    """
+    Closes the module level client session, it is shared process-wide so no single connector instance owns it.
+    """
+    global _default_session
+    if _default_session is not None and not _default_session.closed:
+        await _default_session.close()
+    _default_session = None
 
 
 async def aiohttp_response_with_errors(request_coroutine):
@@ -72,7 +116,7 @@ async def aiohttp_response_with_errors(request_coroutine):
         async with request_coroutine as response:
             http_status = response.status
             try:
-                parsed_response = await response.json()
+                parsed_response = ujson.loads(await response.read())
             except Exception:
                 request_errors = True
                 try:
@@ -82,7 +126,8 @@ async def aiohttp_response_with_errors(request_coroutine):
                 except Exception:
                     pass
             TempFailure = (parsed_response is None or
-                           (response.status not in [200, 201] and "error" not in parsed_response))
+                           (http_status not in _OK_STATUSES and
+                            (not isinstance(parsed_response, dict) or "error" not in parsed_response)))
             if TempFailure:
                 parsed_response = response.reason if parsed_response is None else parsed_response
                 request_errors = True
@@ -94,29 +139,24 @@ async def aiohttp_response_with_errors(request_coroutine):
 async def api_call_with_retries(method,
                                 endpoint,
                                 params: Optional[Dict[str, Any]] = None,
-                                shared_client=None,
-                                try_count: int = 0) -> Dict[str, Any]:
+                                shared_client=None) -> Dict[str, Any]:
     url = f"{Constants.REST_URL}/{endpoint}"
     headers = {"Content-Type": "application/json"}
-    http_client = shared_client if shared_client is not None else aiohttp.ClientSession()
-    # Build request coro
-    response_coro = http_client.request(method=method.upper(), url=url, headers=headers,
-                                        params=params, timeout=Constants.API_CALL_TIMEOUT)
-    http_status, parsed_response, request_errors = await aiohttp_response_with_errors(response_coro)
-    if shared_client is None:
-        await http_client.close()
-    if request_errors or parsed_response is None:
+    for try_count in range(Constants.API_MAX_RETRIES + 1):
+        # Resolved per attempt, the shared session may have been closed and recreated while sleeping
+        http_client = shared_client if shared_client is not None else await _get_session()
+        # Build request coro
+        response_coro = http_client.request(method=method.upper(), url=url, headers=headers,
+                                            params=params, timeout=Constants.API_CALL_TIMEOUT)
+        http_status, parsed_response, request_errors = await aiohttp_response_with_errors(response_coro)
+        if not request_errors and parsed_response is not None:
+            return parsed_response
         if try_count < Constants.API_MAX_RETRIES:
-            try_count += 1
-            time_sleep = retry_sleep_time(try_count)
+            time_sleep = retry_sleep_time(try_count + 1)
             print(f"Error fetching data from {url}. HTTP status is {http_status}. "
                   f"Retrying in {time_sleep:.0f}s.")
             await asyncio.sleep(time_sleep)
-            return await api_call_with_retries(method=method, endpoint=endpoint, params=params,
-                                               shared_client=shared_client, try_count=try_count)
-        else:
-            raise XeggexAPIError({"error": parsed_response, "status": http_status})
-    return parsed_response
+    raise XeggexAPIError({"error": parsed_response, "status": http_status})
 
 
 class XeggexConfigMap(BaseConnectorConfigMap):
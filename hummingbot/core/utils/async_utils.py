@@ -1,9 +1,24 @@
 import asyncio
 import inspect
 import logging
+import os
 import time
 
 
+def install_uvloop():
+    """
+    Switches the asyncio event loop policy to uvloop when opted in with the USE_UVLOOP environment variable and the
+    optional `uvloop` package is installed. Must be called before the event loop is first created.
+    """
+    if os.environ.get("USE_UVLOOP", "").lower() not in ("1", "true", "yes"):
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    uvloop.install()
+
+
 async def safe_wrapper(c):
     try:
         return await c
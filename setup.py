@@ -107,6 +107,10 @@ def main():
         "yarl",
     ]
 
+    extras_require = {
+        "uvloop": ["uvloop"],
+    }
+
     cython_kwargs = {
         "language": "c++",
         "language_level": 3,
@@ -145,6 +149,7 @@ def main():
           packages=packages,
           package_data=package_data,
           install_requires=install_requires,
+          extras_require=extras_require,
           ext_modules=cythonize(cython_sources, compiler_directives=compiler_directives, **cython_kwargs),
           include_dirs=[
               np.get_include()
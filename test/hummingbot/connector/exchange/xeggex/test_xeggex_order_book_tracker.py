@@ -0,0 +1,89 @@
+import asyncio
+from unittest import TestCase
+
+from hummingbot.connector.exchange.xeggex.xeggex_order_book import XeggexOrderBook
+from hummingbot.connector.exchange.xeggex.xeggex_order_book_message import XeggexOrderBookMessage
+from hummingbot.connector.exchange.xeggex.xeggex_order_book_tracker import XeggexOrderBookTracker, _order_book_rows
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+class XeggexOrderBookTrackerUnitTest(TestCase):
+    # logging.Level required to receive logs from the tracker
+    level = 0
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.base_asset = "COINALPHA"
+        cls.quote_asset = "HBOT"
+        cls.trading_pair = f"{cls.base_asset}-{cls.quote_asset}"
+
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.log_records = []
+        self.tracker: XeggexOrderBookTracker = XeggexOrderBookTracker([self.trading_pair])
+        self.tracking_task = None
+
+        # Simulate start()
+        self.tracker._order_books[self.trading_pair] = XeggexOrderBook()
+        self.tracker._tracking_message_queues[self.trading_pair] = asyncio.Queue()
+        self.tracker._order_books_initialized.set()
+
+        self.tracker.logger().setLevel(1)
+        self.tracker.logger().addHandler(self)
+
+    def tearDown(self) -> None:
+        self.tracking_task and self.tracking_task.cancel()
+        self.tracker.logger().removeHandler(self)
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def simulate_queue_order_book_messages(self, message: XeggexOrderBookMessage):
+        message_queue = self.tracker._tracking_message_queues[self.trading_pair]
+        message_queue.put_nowait(message)
+
+    def run_tracker(self, timeout: float = 0.5):
+        with self.assertRaises(asyncio.TimeoutError):
+            self.tracking_task = self.ev_loop.create_task(asyncio.wait_for(
+                self.tracker._track_single_book(self.trading_pair),
+                timeout
+            ))
+            self.ev_loop.run_until_complete(self.tracking_task)
+
+    def test_order_book_rows_empty_side(self):
+        self.assertEqual([], _order_book_rows([], 1))
+        self.assertEqual([], _order_book_rows(None, 1))
+
+    def test_order_book_rows_list_levels(self):
+        rows = _order_book_rows([["7221.08", "6.92"], ["7220.08", "0.5"]], 1000)
+
+        self.assertEqual([OrderBookRow(7221.08, 6.92, 1000), OrderBookRow(7220.08, 0.5, 1000)], rows)
+
+    def test_order_book_rows_dict_levels(self):
+        rows = _order_book_rows([{"price": "7199.27", "quantity": "6.95"}, {"price": "7196.15", "quantity": "0"}], 1000)
+
+        self.assertEqual([OrderBookRow(7199.27, 6.95, 1000), OrderBookRow(7196.15, 0.0, 1000)], rows)
+
+    def test_track_single_book_applies_diff_with_asks_only(self):
+        snapshot_msg = XeggexOrderBook.snapshot_message_from_exchange(
+            {"bids": [["7199.27", "6.95"]], "asks": [["7221.08", "6.92"]]},
+            1527777538.0,
+            metadata={"trading_pair": self.trading_pair})
+        diff_msg = XeggexOrderBook.diff_message_from_exchange(
+            {"bids": [], "asks": [{"price": "7210.5", "quantity": "1.5"}]},
+            1527777539.0,
+            metadata={"trading_pair": self.trading_pair})
+        self.simulate_queue_order_book_messages(snapshot_msg)
+        self.simulate_queue_order_book_messages(diff_msg)
+
+        self.run_tracker()
+
+        order_book = self.tracker.order_books[self.trading_pair]
+        self.assertEqual(1527777539000, order_book.last_diff_uid)
+        self.assertAlmostEqual(7210.5, order_book.get_price(True))
+        self.assertAlmostEqual(7199.27, order_book.get_price(False))
+        self.assertFalse(any(record.levelname == "ERROR" for record in self.log_records))
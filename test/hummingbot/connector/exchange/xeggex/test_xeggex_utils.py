@@ -0,0 +1,118 @@
+import asyncio
+from typing import Awaitable
+from unittest import TestCase
+from unittest.mock import patch
+
+from aioresponses import aioresponses
+from dateutil.parser import parse as dateparse
+
+from hummingbot.connector.exchange.xeggex import xeggex_utils as utils
+from hummingbot.connector.exchange.xeggex.xeggex_constants import Constants
+
+
+class XeggexUtilsTests(TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.url = f"{Constants.REST_URL}/{Constants.ENDPOINT['TICKER']}"
+
+    def setUp(self) -> None:
+        super().setUp()
+        utils.str_date_to_ts.cache_clear()
+
+    def tearDown(self) -> None:
+        self.async_run_with_timeout(utils.close_shared_session())
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_str_date_to_ts_matches_dateutil(self):
+        dates = [
+            "2023-01-01T12:34:56.789Z",
+            "2023-01-01T12:34:56Z",
+            "2024-02-29T23:59:59.999Z",
+            "2000-02-29T00:00:00Z",
+            "1900-03-01T00:00:00.000Z",
+            "2100-12-31T23:59:59Z",
+            "1970-01-01T00:00:00Z",
+        ]
+        for date in dates:
+            self.assertEqual(int(dateparse(date).timestamp()), utils.str_date_to_ts(date), date)
+
+    def test_str_date_to_ts_fast_path_does_not_use_dateutil(self):
+        with patch.object(utils, "dateparse") as dateparse_mock:
+            self.assertEqual(1672576496, utils.str_date_to_ts("2023-01-01T12:34:56.789Z"))
+            dateparse_mock.assert_not_called()
+
+    def test_str_date_to_ts_raises_for_out_of_range_dates(self):
+        for date in ["2023-02-30T00:00:00Z", "2023-01-01T25:00:00Z", "2023-01-01T00:60:00Z", "2023-13-01T00:00:00Z"]:
+            with self.assertRaises(ValueError, msg=date):
+                utils.str_date_to_ts(date)
+
+    def test_str_date_to_ts_offset_falls_through_to_dateutil(self):
+        date = "2023-01-01T12:34:56+02:00"
+        with patch.object(utils, "dateparse", wraps=dateparse) as dateparse_mock:
+            self.assertEqual(1672569296, utils.str_date_to_ts(date))
+            dateparse_mock.assert_called_once_with(date)
+
+    @aioresponses()
+    def test_api_call_with_retries_success_on_first_try(self, mock_api):
+        mock_api.get(self.url, body='[{"symbol": "HBOT/USDT"}]')
+
+        with patch.object(utils, "retry_sleep_time", return_value=0) as sleep_time_mock:
+            response = self.async_run_with_timeout(utils.api_call_with_retries("GET", Constants.ENDPOINT["TICKER"]))
+
+        self.assertEqual([{"symbol": "HBOT/USDT"}], response)
+        sleep_time_mock.assert_not_called()
+
+    @aioresponses()
+    def test_api_call_with_retries_success_after_failures(self, mock_api):
+        mock_api.get(self.url, status=500, body="Internal Server Error")
+        mock_api.get(self.url, status=502, body="Bad Gateway")
+        mock_api.get(self.url, body='[{"symbol": "HBOT/USDT"}]')
+
+        with patch.object(utils, "retry_sleep_time", return_value=0) as sleep_time_mock:
+            response = self.async_run_with_timeout(utils.api_call_with_retries("GET", Constants.ENDPOINT["TICKER"]))
+
+        self.assertEqual([{"symbol": "HBOT/USDT"}], response)
+        self.assertEqual([((1,),), ((2,),)], sleep_time_mock.call_args_list)
+
+    @aioresponses()
+    def test_api_call_with_retries_raises_after_max_retries(self, mock_api):
+        for _ in range(Constants.API_MAX_RETRIES + 1):
+            mock_api.get(self.url, status=500, body="Internal Server Error")
+
+        with patch.object(utils, "retry_sleep_time", return_value=0) as sleep_time_mock:
+            with self.assertRaises(utils.XeggexAPIError) as context:
+                self.async_run_with_timeout(utils.api_call_with_retries("GET", Constants.ENDPOINT["TICKER"]))
+
+        self.assertEqual(500, context.exception.error_payload["status"])
+        self.assertEqual(Constants.API_MAX_RETRIES, sleep_time_mock.call_count)
+        self.assertEqual(Constants.API_MAX_RETRIES + 1, len(list(mock_api.requests.values())[0]))
+
+    @aioresponses()
+    def test_api_call_with_retries_gets_new_session_after_close(self, mock_api):
+        mock_api.get(self.url, status=500, body="Internal Server Error")
+        mock_api.get(self.url, body='[{"symbol": "HBOT/USDT"}]')
+        response_with_errors = utils.aiohttp_response_with_errors
+        sessions = []
+
+        async def close_after_first_attempt(request_coroutine):
+            result = await response_with_errors(request_coroutine)
+            sessions.append(utils._default_session)
+            if len(sessions) == 1:
+                await utils.close_shared_session()
+            return result
+
+        with patch.object(utils, "retry_sleep_time", return_value=0), \
+                patch.object(utils, "aiohttp_response_with_errors", side_effect=close_after_first_attempt):
+            response = self.async_run_with_timeout(utils.api_call_with_retries("GET", Constants.ENDPOINT["TICKER"]))
+
+        self.assertEqual([{"symbol": "HBOT/USDT"}], response)
+        self.assertTrue(sessions[0].closed)
+        self.assertIsNot(sessions[0], sessions[1])
+        self.assertFalse(sessions[1].closed)